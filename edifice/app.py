@@ -1,6 +1,8 @@
 from . import logger as _logger_module
 import asyncio
+import collections
 import contextlib
+import logging
 import os
 import sys
 import queue
@@ -182,8 +184,10 @@ class App(object):
             def event(_self, e):
                 if e.type() == self._file_change_rerender_event_type:
                     e.accept()
-                    while not self._class_rerender_queue.empty():
-                        file_name, classes = self._class_rerender_queue.get_nowait()
+                    # This is the only consumer of _class_rerender_queue, so
+                    # popleft() after a non-empty check can't fail.
+                    while self._class_rerender_queue:
+                        file_name, classes = self._class_rerender_queue.popleft()
                         try:
                             self._render_engine._refresh_by_class(classes)
                         except Exception as exception:
@@ -220,7 +224,6 @@ class App(object):
 
                             continue
 
-                        self._class_rerender_queue.task_done()
                         self._class_rerender_response_queue.put_nowait(True)
                         logger.info("Rerendering Elements in %s due to source change", file_name)
                     return True
@@ -228,7 +231,7 @@ class App(object):
                     return super().event(e)
 
         self._event_receiver = EventReceiverWidget()
-        self._class_rerender_queue = queue.Queue()
+        self._class_rerender_queue: collections.deque[tuple[str, list]] = collections.deque()
         self._class_rerender_response_queue = queue.Queue()
 
         self._inspector = inspector
@@ -271,12 +274,14 @@ class App(object):
         if not self._first_render:
             render_timing = self._render_timing
             render_timing.update(end_time - start_time)
-            self._logger.info(
-                "Rendered %d times, with average render time of %.2f ms and worst render time of %.2f ms",
-                render_timing.count(),
-                1000 * render_timing.mean(),
-                1000 * render_timing.max(),
-            )
+            # Logging is usually disabled, so don't format the timing on every render.
+            if logger.isEnabledFor(logging.INFO):
+                self._logger.info(
+                    "Rendered %d times, with average render time of %.2f ms and worst render time of %.2f ms",
+                    render_timing.count(),
+                    1000 * render_timing.mean(),
+                    1000 * render_timing.max(),
+                )
         self._first_render = False
 
         if self._inspector_component is not None and not any(
@@ -7,6 +7,7 @@ import inspect
 import logging
 from textwrap import dedent
 import threading
+from types import MappingProxyType
 import typing as tp
 from typing_extensions import Self
 
@@ -22,6 +23,9 @@ _T_Element = tp.TypeVar("_T_Element", bound="Element")
 _T_widget = tp.TypeVar("_T_widget", bound=QtWidgets.QWidget)
 logger = logging.getLogger("Edifice")
 
+_MISSING = object()
+"""Sentinel default for single-lookup getattr() and dict.get() probes."""
+
 P = tp.ParamSpec("P")
 
 StyleType = tp.Optional[tp.Union[tp.Mapping[tp.Text, tp.Any], tp.Sequence[tp.Mapping[tp.Text, tp.Any]]]]
@@ -52,6 +56,8 @@ def _ensure_future(fn):
 
 
 class CommandType:
+    __slots__ = ("fn", "args", "kwargs")
+
     def __init__(self, fn: Callable[P, tp.Any], *args: P.args, **kwargs: P.kwargs):
         # The return value of fn is ignored and should thus return None. However, in
         # order to test with equality on the CommandTypes we need to allow fn to return
@@ -126,12 +132,12 @@ class PropsDict(object):
 
     @property
     def _keys(self) -> Iterator:
-        """Returns the keys of the props dict as a list."""
+        """Returns the keys of the props dict as a dict keys view."""
         return self._d.keys()
 
     @property
     def _items(self) -> Iterator:
-        """Returns the (key, value) of the props dict as a list."""
+        """Returns the (key, value) of the props dict as a dict items view."""
         return self._d.items()
 
     def _get(self, key: tp.Text, default: tp.Optional[tp.Any] = None) -> tp.Any:
@@ -158,9 +164,10 @@ class PropsDict(object):
         return k in self._d
 
     def __getattr__(self, key) -> tp.Any:
-        if key in self._d:
-            return self._d[key]
-        raise KeyError("%s not in props" % key)
+        value = self._d.get(key, _MISSING)
+        if value is _MISSING:
+            raise AttributeError("%s not in props" % key)
+        return value
 
     def __repr__(self):
         return "PropsDict(%s)" % repr(self._d)
@@ -172,6 +179,37 @@ class PropsDict(object):
         raise ValueError("Props are immutable")
 
 
+_EMPTY_PROPS: tp.Mapping[str, tp.Any] = MappingProxyType({})
+"""Shared empty props mapping. Read-only because it is shared."""
+
+
+def _make_props_dict_class(name: str, parameters: Iterable[inspect.Parameter]) -> type[PropsDict]:
+    """
+    Make a PropsDict subclass with a property for each prop named by the
+    parameters, and for children.
+
+    When the prop names of an Element are known in advance, reading
+    :code:`props.myprop` through a property is faster than falling back
+    to PropsDict.__getattr__. Other props are still found by __getattr__.
+    """
+
+    def prop_getter(key: str) -> property:
+        def getter(self):
+            value = self._d.get(key, _MISSING)
+            if value is _MISSING:
+                raise AttributeError("%s not in props" % key)
+            return value
+
+        return property(getter)
+
+    namespace: dict[str, tp.Any] = {"__slots__": (), "children": prop_getter("children")}
+    for parameter in parameters:
+        # *args and **kwargs parameters are not props.
+        if parameter.kind in (parameter.POSITIONAL_OR_KEYWORD, parameter.KEYWORD_ONLY) and parameter.name[0] != "_":
+            namespace[parameter.name] = prop_getter(parameter.name)
+    return type(name, (PropsDict,), namespace)
+
+
 class Reference(tp.Generic[_T_Element]):
     """Reference to a :class:`Element` to allow imperative modifications.
 
@@ -292,12 +330,16 @@ class Tracker(tp.Generic[_T_Element]):
 
     def collect(self) -> list["Element"]:
         """Collect all the children for the component, except for... something?"""
+        # find_components(child) - {child} is empty for an Element child,
+        # so only list children can contribute nested elements. According
+        # to append_child it's impossible for child to be a list, so usually
+        # we don't need to allocate any sets here.
         children = set()
         for child in self.children:
-            # find_components will flatten lists of elements, but according
-            # to append_child, it's impossible for child to be a list.
-            # So why do we need find_components?
-            children |= find_components(child) - {child}
+            if isinstance(child, list):
+                children |= find_components(child)
+        if not children:
+            return self.children
         return [child for child in self.children if child not in children]
 
 
@@ -316,7 +358,6 @@ class _RenderContext(object):
         "widget_tree",
         "enqueued_deletions",
         "trackers",
-        "_callback_queue",
         "engine",
         "current_element",
     )
@@ -333,7 +374,7 @@ class _RenderContext(object):
     ):
         self.engine = engine
         self.need_qt_command_reissue = {}
-        self.component_to_old_props = {}
+        self.component_to_old_props: dict[Element, dict[str, tp.Any]] = {}
 
         self.component_tree: dict[Element, list[Element]] = {}
         """
@@ -345,21 +386,19 @@ class _RenderContext(object):
         """
         self.enqueued_deletions: list[Element] = []
 
-        self._callback_queue = []
-
         self.trackers = []
 
         self.current_element = None
 
-    def mark_props_change(self, component: "Element", newprops: PropsDict):
+    def mark_props_change(self, component: "Element", newprops: dict[str, tp.Any]):
+        # The props dicts are stored and assigned as they are, without
+        # wrapping them in a PropsDict or copying them.
         if component not in self.component_to_old_props:
-            self.component_to_old_props[component] = component.props
-        component._props = newprops._d
+            self.component_to_old_props[component] = component._props
+        component._props = newprops
 
-    def get_old_props(self, component):
-        if component in self.component_to_old_props:
-            return self.component_to_old_props[component]
-        return PropsDict({})
+    def get_old_props(self, component) -> tp.Mapping[str, tp.Any]:
+        return self.component_to_old_props.get(component, _EMPTY_PROPS)
 
     def mark_qt_rerender(self, component: "QtWidgetElement", need_rerender: bool):
         self.need_qt_command_reissue[component] = need_rerender
@@ -393,14 +432,29 @@ class Element:
     by the external caller and should not be modified by this :class:`Element`.
     """
 
-    _render_changes_context: dict | None = None
-    _render_unwind_context: dict | None = None
+    # Fixed slots for the internal attributes which every Element has.
+    # Subclasses and render functions may still set arbitrary attributes,
+    # which go in __dict__.
+    __slots__ = (
+        "_props",
+        "_props_view",
+        "_edifice_internal_references",
+        "_initialized",
+        "_hook_state_index",
+        "_hook_effect_index",
+        "_hook_async_index",
+        "__dict__",
+        "__weakref__",
+    )
+
     _controller: ControllerProtocol | None = None
-    _edifice_internal_references: set[Reference[Self]] | None = None
+    _key: tp.Text | None = None
+    _props_dict_class: type[PropsDict] = PropsDict
 
     def __init__(self):
-        super().__setattr__("_edifice_internal_references", set())
+        self._edifice_internal_references: set[Reference[Self]] = set()
         self._props: dict[str, tp.Any] = {"children": []}
+        self._props_view: PropsDict | None = None
         # Ensure we only construct this element once
         assert getattr(self, "_initialized", False) is False
         self._initialized = True
@@ -471,7 +525,6 @@ class Element:
         Returns:
             The Element self.
         """
-        assert self._edifice_internal_references is not None
         self._edifice_internal_references.add(reference)
         return self
 
@@ -483,7 +536,13 @@ class Element:
     @property
     def props(self) -> PropsDict:
         """The props of this Element."""
-        return PropsDict(self._props)
+        # The PropsDict is a read-only view of the _props dict, so we only
+        # need to construct a new one when _props is replaced.
+        view = self._props_view
+        if view is None or view._d is not self._props:
+            view = self._props_dict_class(self._props)
+            self._props_view = view
+        return view
 
     def _should_update(self, newprops: PropsDict) -> bool:
         """Determines if the Element should rerender upon receiving new props and state.
@@ -505,11 +564,16 @@ class Element:
         # return True, because the children will always be different, because
         # _recycle_children hasn't been called yet. Is that correct behavior?
 
-        for k, v in newprops._items:
-            if k in self.props:
+        old_props = self._props
+        # The render engine only calls this after it has found that the props
+        # are not equal, so don't compare the whole dicts again here.
+        for k, v in newprops._d.items():
+            if k in old_props:
                 # If the prop is in the old props, then we check if it's changed.
-                v2 = self.props._get(k)
-                if v2 != v:
+                # Most props are passed through unchanged from render to render,
+                # so check identity before the (possibly expensive) __eq__.
+                v2 = old_props[k]
+                if v2 is not v and v2 != v:
                     return True
             else:
                 # If the prop is not in the old props, then we rerender.
@@ -524,25 +588,30 @@ class Element:
                 children.extend(a)
             elif a:
                 children.append(a)
-        self._props["children"] = children
+        old_children = self._props["children"]
+        # Keep the old list if it holds the same Elements, so that prop
+        # comparison can short-circuit on identity.
+        if len(old_children) != len(children) or any(a is not b for a, b in zip(old_children, children)):
+            self._props["children"] = children
         return self
 
     def __hash__(self):
         return id(self)
 
+    def _tag_attrs(self) -> str:
+        return " ".join("%s=%s" % (p, val) for (p, val) in self._props.items() if p != "children")
+
     def _tags(self):
         classname = self.__class__.__name__
+        attrs = self._tag_attrs()
         return [
-            f"<{classname} id=0x%x %s>"
-            % (id(self), " ".join("%s=%s" % (p, val) for (p, val) in self.props._items if p != "children")),
+            f"<{classname} id=0x%x %s>" % (id(self), attrs),
             "</%s>" % (classname),
-            f"<{classname} id=0x%x %s />"
-            % (id(self), " ".join("%s=%s" % (p, val) for (p, val) in self.props._items if p != "children")),
+            f"<{classname} id=0x%x %s />" % (id(self), attrs),
         ]
 
     def __str__(self):
-        tags = self._tags()
-        return tags[2]
+        return f"<{self.__class__.__name__} id=0x%x %s />" % (id(self), self._tag_attrs())
 
     def _render_element(self) -> tp.Optional["Element"]:
         """Logic for rendering, must be overridden.
@@ -668,18 +737,28 @@ def component(f: Callable[tp.Concatenate[selfT, P], None]) -> Callable[P, Elemen
             Subsequent arguments are **props**.
 
     """
-    varnames = f.__code__.co_varnames[1:]
+    # Inspect the render function once here, at decoration time, so that
+    # constructing and rendering the Element does no signature introspection.
+    varnames = f.__code__.co_varnames[1 : f.__code__.co_argcount]
     signature = inspect.signature(f).parameters
     defaults = {k: v.default for k, v in signature.items() if v.default is not inspect.Parameter.empty and k[0] != "_"}
+    takes_children = "children" in signature
+    # Positional parameters starting with "_" are not props. They are rare,
+    # so only pay for filtering them out if the function has any.
+    has_ignored_args = any(name[0] == "_" for name in varnames)
 
     class ComponentElement(Element):
         _edifice_original = f
+        _props_dict_class = _make_props_dict_class(f.__name__ + "Props", list(signature.values())[1:])
 
         @functools.wraps(f)
         def __init__(self, *args: P.args, **kwargs: P.kwargs):
             super().__init__()
             name_to_val = defaults.copy()
-            name_to_val.update(filter(not_ignored, zip(varnames, args, strict=False)))
+            if has_ignored_args:
+                name_to_val.update(filter(not_ignored, zip(varnames, args, strict=False)))
+            else:
+                name_to_val.update(zip(varnames, args, strict=False))
             name_to_val.update(((k, v) for (k, v) in kwargs.items() if k[0] != "_"))
             name_to_val["children"] = name_to_val.get("children") or []
             self._register_props(name_to_val)
@@ -688,7 +767,7 @@ def component(f: Callable[tp.Concatenate[selfT, P], None]) -> Callable[P, Elemen
             props: dict[str, tp.Any] = self.props._d
             params = props.copy()
 
-            if "children" not in varnames:
+            if not takes_children:
                 del params["children"]
 
             # We cannot type this because PropsDict forgets the types
@@ -1445,18 +1524,23 @@ def qt_component(
         list[CommandType],
     ],
 ) -> Callable[P, QtWidgetElement[_T_widget]]:
-    varnames = f.__code__.co_varnames[3:]
+    varnames = f.__code__.co_varnames[3 : f.__code__.co_argcount]
+    has_ignored_args = any(name[0] == "_" for name in varnames)
     signature = inspect.signature(f).parameters
     defaults = {k: v.default for k, v in signature.items() if v.default is not inspect.Parameter.empty and k[0] != "_"}
 
     class ComponentElement(QtWidgetElement):
         _edifice_original = f
+        _props_dict_class = _make_props_dict_class(f.__name__ + "Props", list(signature.values())[3:])
 
         @functools.wraps(f)
         def __init__(self, *args: P.args, **kwargs: P.kwargs):
             super().__init__()
             name_to_val = defaults.copy()
-            name_to_val.update(filter(not_ignored, zip(varnames, args, strict=False)))
+            if has_ignored_args:
+                name_to_val.update(filter(not_ignored, zip(varnames, args, strict=False)))
+            else:
+                name_to_val.update(zip(varnames, args, strict=False))
             name_to_val.update(((k, v) for (k, v) in kwargs.items() if k[0] != "_"))
             self._register_props(name_to_val)
 
@@ -1533,6 +1617,8 @@ class RenderResult(object):
     which must be executed by the caller.
     """
 
+    __slots__ = ("commands",)
+
     def __init__(
         self,
         commands: list[CommandType],
@@ -1540,13 +1626,13 @@ class RenderResult(object):
         self.commands: list[CommandType] = commands
 
 
-@dataclass
+@dataclass(slots=True)
 class _HookState:
     state: tp.Any
     updaters: list[tp.Callable[[tp.Any], tp.Any]]
 
 
-@dataclass
+@dataclass(slots=True)
 class _HookEffect:
     setup: tp.Callable[[], tp.Callable[[], None] | None] | None
     cleanup: tp.Callable[[], None] | None
@@ -1556,7 +1642,7 @@ class _HookEffect:
     dependencies: tp.Any
 
 
-@dataclass
+@dataclass(slots=True)
 class _HookAsync:
     task: asyncio.Task[tp.Any] | None
     """
@@ -1572,20 +1658,54 @@ class _HookAsync:
     """
 
 
+def _changed_props(old_props: tp.Mapping[str, tp.Any], new_props: tp.Mapping[str, tp.Any]) -> dict[str, tp.Any]:
+    """
+    The props in new_props which are not in old_props or which differ from
+    their value in old_props.
+    """
+    changed = {}
+    for k, v in new_props.items():
+        if k not in old_props:
+            changed[k] = v
+        else:
+            v_old = old_props[k]
+            if v_old is not v and v_old != v:
+                changed[k] = v
+    return changed
+
+
+def _shallow_props_equal(old_props: dict[str, tp.Any], new_props: dict[str, tp.Any]) -> bool:
+    """
+    True if the props have the same keys and each value is identical or __eq__.
+    """
+    # Dict equality runs in C and compares each value for identity before
+    # calling __eq__, which is usually enough because most props are passed
+    # through unchanged.
+    return old_props is new_props or old_props == new_props
+
+
+@functools.cache
+def _required_prop_names(cls: type[Element]) -> tuple[str, ...]:
+    """
+    The names of the props which must be passed to construct an Element of class cls.
+
+    Cached because inspect.signature is slow and a hot reload replaces
+    many Elements of the same class.
+    """
+    parameters = list(inspect.signature(cls.__init__).parameters.items())[1:]
+    return tuple(k for k, v in parameters if v.default is inspect.Parameter.empty and k[0] != "_" and k != "kwargs")
+
+
 def elements_match(a: Element, b: Element) -> bool:
     """
     Should return True if element b can be used to update element a
     by _update_old_component().
     """
-    # Elements must be of the same __class__.
-    # Elements must have the same __class__.__name__. This is to distinguish
-    # between different @component Components. (Why does class __eq__ return
-    # True if the class __name__ is different?)
-    return (
-        (a.__class__ == b.__class__)
-        and (a.__class__.__name__ == b.__class__.__name__)
-        and (getattr(a, "_key", None) == getattr(b, "_key", None))
-    )
+    # Elements must be of the same class. Each @component function gets its
+    # own ComponentElement class, so comparing class identity also
+    # distinguishes between different @component Components. Classes compare
+    # by identity, so there is no need to also compare the class __name__.
+    return type(a) is type(b) and a._key == b._key
 
 
 class RenderEngine(object):
@@ -1601,6 +1721,7 @@ class RenderEngine(object):
         "_hook_state",
         "_hook_state_setted",
         "_hook_effect",
+        "_hook_effect_setted",
         "_hook_async",
         "is_stopped",
     )
@@ -1630,6 +1751,11 @@ class RenderEngine(object):
         """
         The per-element hooks for use_effect().
         """
+        self._hook_effect_setted: dict[Element, None] = {}
+        """
+        The elements which have use_effect() setup functions waiting to run
+        after the render, in the order in which they were scheduled.
+        """
         self._hook_async: defaultdict[Element, list[_HookAsync]] = defaultdict(list)
         """
         The per-element hooks for use_async().
@@ -1671,6 +1797,7 @@ class RenderEngine(object):
                     except Exception:
                         pass
             del self._hook_effect[component]
+        self._hook_effect_setted.pop(component, None)
         # Clean up use_async for the component
         if component in self._hook_async:
             for hook in self._hook_async[component]:
@@ -1697,7 +1824,6 @@ class RenderEngine(object):
         # Clean up component references
         # Do this after use_effect cleanup, so that the cleanup function
         # can still access the component References.
-        assert component._edifice_internal_references is not None
         for ref in component._edifice_internal_references:
             ref._value = None
         del self._component_tree[component]
@@ -1717,80 +1843,87 @@ class RenderEngine(object):
         # components_to_replace is (old_component, new_component_class, parent component, new_component)
         components_to_replace = []
         # classes should be only ComponentElement, because only ComponentElement can change in user code.
-        old_components = [cls for cls, _ in classes]
-
-        def traverse(comp, parent):
-            if comp.__class__ in old_components and parent is not None:  # We can't replace the unparented root
-                new_component_class = [new_cls for old_cls, new_cls in classes if old_cls == comp.__class__][0]
+        old_to_new_class = dict(classes)
+
+        # Depth-first pre-order traversal with an explicit stack of (component, parent).
+        stack: list[tuple[Element, Element | None]] = [(self._root, None)]
+        while stack:
+            comp, parent = stack.pop()
+            if comp.__class__ in old_to_new_class and parent is not None:  # We can't replace the unparented root
+                new_component_class = old_to_new_class[comp.__class__]
                 if new_component_class is None:
                     raise ValueError("Error after updating code: cannot find class %s" % comp.__class__)
                 components_to_replace.append([comp, new_component_class, parent, None])
-                return
+                continue
             sub_components = self._component_tree[comp]
             if isinstance(sub_components, list):
-                for sub_comp in sub_components:
-                    traverse(sub_comp, comp)
+                stack.extend((sub_comp, comp) for sub_comp in reversed(sub_components))
             else:
-                traverse(sub_components, comp)
-
-        traverse(self._root, None)
+                stack.append((sub_components, comp))
         # 2) For all such old components, construct a new component and merge in old component props
         for parts in components_to_replace:
             old_comp, new_comp_class, _, _ = parts
-            parameters = list(inspect.signature(new_comp_class.__init__).parameters.items())
+            required_prop_names = _required_prop_names(new_comp_class)
 
             try:
-                kwargs = {
-                    k: old_comp.props[k]
-                    for k, v in parameters[1:]
-                    if v.default is inspect.Parameter.empty and k[0] != "_" and k != "kwargs"
-                }
+                kwargs = {k: old_comp._props[k] for k in required_prop_names}
             # We don't actually need all the kwargs, just enough
             # to construct new_comp_class.
             # The other kwargs will be set with _props.update.
             except KeyError:
-                k = None
-                for k, _ in parameters[1:]:
-                    if k not in old_comp.props:
-                        break
+                missing = sorted(set(required_prop_names) - old_comp._props.keys())
                 raise ValueError(
-                    f"Error while reloading {old_comp}: " f"New class expects prop ({k}) not present in old class"
+                    f"Error while reloading {old_comp}: "
+                    f"New class expects props ({', '.join(missing)}) not present in old class"
                 )
             parts[3] = new_comp_class(**kwargs)
             parts[3]._props.update(old_comp._props)
-            if hasattr(old_comp, "_key"):
+            if old_comp._key is not None:
                 parts[3]._key = old_comp._key
 
         # 3) Replace old component in the place in the tree where they first appear, with a reference to new component
 
-        backup = {}
+        # Group the replacements by parent so that each parent's children
+        # are rebuilt in a single pass.
+        replacements_by_parent: dict[Element, dict[int, tuple[Element, Element]]] = {}
         for old_comp, _, parent_comp, new_comp in components_to_replace:
-            backup[parent_comp] = list(parent_comp.children)
-            for i, comp in enumerate(parent_comp.children):
-                if comp is old_comp:
-                    parent_comp._props["children"][i] = new_comp
-                    # Move the hook states to the new component.
-                    # We want to be careful that the hooks don't have
-                    # any references to the old component, especially
-                    # function closures. I think this code is okay.
-                    #
-                    # During the effect functions and the async coroutine, usually
-                    # what happens is that some use_state setters are called,
-                    # and those use_state setters would be closures on the
-                    # state which was moved, not references to the old_comp.
-                    #
-                    # Because this is only during hot-reload, so only during
-                    # development, it's not catastrophic if some references
-                    # to old_comp are retained and cause bugs.
-                    if old_comp in self._hook_state:
-                        self._hook_state[new_comp] = self._hook_state[old_comp]
-                        del self._hook_state[old_comp]
-                    if old_comp in self._hook_effect:
-                        self._hook_effect[new_comp] = self._hook_effect[old_comp]
-                        del self._hook_effect[old_comp]
-                    if old_comp in self._hook_async:
-                        self._hook_async[new_comp] = self._hook_async[old_comp]
-                        del self._hook_async[old_comp]
+            replacements_by_parent.setdefault(parent_comp, {})[id(old_comp)] = (old_comp, new_comp)
+
+        backup = {}
+        for parent_comp, id_to_replacement in replacements_by_parent.items():
+            old_children = parent_comp.children
+            new_children = []
+            for comp in old_children:
+                replacement = id_to_replacement.get(id(comp))
+                if replacement is None:
+                    new_children.append(comp)
+                    continue
+                old_comp, new_comp = replacement
+                new_children.append(new_comp)
+                # Move the hook states to the new component.
+                # We want to be careful that the hooks don't have
+                # any references to the old component, especially
+                # function closures. I think this code is okay.
+                #
+                # During the effect functions and the async coroutine, usually
+                # what happens is that some use_state setters are called,
+                # and those use_state setters would be closures on the
+                # state which was moved, not references to the old_comp.
+                #
+                # Because this is only during hot-reload, so only during
+                # development, it's not catastrophic if some references
+                # to old_comp are retained and cause bugs.
+                if old_comp in self._hook_state:
+                    self._hook_state[new_comp] = self._hook_state.pop(old_comp)
+                if old_comp in self._hook_effect:
+                    self._hook_effect[new_comp] = self._hook_effect.pop(old_comp)
+                if old_comp in self._hook_effect_setted:
+                    del self._hook_effect_setted[old_comp]
+                    self._hook_effect_setted[new_comp] = None
+                if old_comp in self._hook_async:
+                    self._hook_async[new_comp] = self._hook_async.pop(old_comp)
+            backup[parent_comp] = list(old_children)
+            parent_comp._props["children"] = new_children
 
         # 5) call _render for all new component parents
         try:
@@ -1812,29 +1945,36 @@ class RenderEngine(object):
         # new_component is a new rendering of old component, so update
         # old component to have props of new_component.
         # The new_component will be discarded.
-        assert component._edifice_internal_references is not None
-        assert new_component._edifice_internal_references is not None
         newprops = new_component.props
-        # TODO are we leaking memory by holding onto the old references?
-        component._edifice_internal_references.update(new_component._edifice_internal_references)
+        if new_component is not component:
+            # TODO are we leaking memory by holding onto the old references?
+            component._edifice_internal_references.update(new_component._edifice_internal_references)
         # component needs re-rendering if
         #  1) props changed
         #  2) state changed
         #  3) it has any pending _hook_state updates
-        #  4) it has any references
-        if (
-            component._should_update(newprops)
-            or len(component._edifice_internal_references) > 0
-            or component in self._hook_state_setted
-        ):
-            render_context.mark_props_change(component, newprops)
+        #
+        # Usually the props are unchanged (often they are the very same props
+        # because the same Element instance was rendered again), and then we
+        # don't need to ask _should_update or replace the props at all.
+        props_equal = _shallow_props_equal(component._props, newprops._d)
+        if component in self._hook_state_setted or (not props_equal and component._should_update(newprops)):
+            render_context.mark_props_change(component, newprops._d)
             rerendered_obj = self._render(component, render_context)
             render_context.mark_qt_rerender(rerendered_obj.component, True)
             return rerendered_obj
 
-        # TODO So _should_update returned False but then we call
-        # mark_props_change? What does mark_props_change mean then?
-        render_context.mark_props_change(component, newprops)
+        # If the props are not equal then _should_update returned False, but it
+        # only looks at the keys in newprops and it may be overridden to ignore
+        # some props, so we still take the new props.
+        # If the props are equal we still record them as the old props, because
+        # the widget of this component may be marked for a Qt rerender by a
+        # re-rendered parent, and then only the changed props should be sent.
+        render_context.mark_props_change(component, component._props if props_equal else newprops._d)
+        # The subtree is unchanged so we skip rendering it, but references
+        # registered on new_component must now point to component.
+        for ref in component._edifice_internal_references:
+            ref._value = component
         return self._widget_tree[component]
 
     def _recycle_children(self, component: QtWidgetElement, render_context: _RenderContext) -> list[Element]:
@@ -1852,20 +1992,23 @@ class RenderEngine(object):
 
         widgettree = _WidgetTree(component, [])
 
-        # We will mutate children_old to reuse and remove old elements if we can match them.
-        # Ordering of children_old must be preserved for reverse deletion.
-        children_old: list[Element] = children_old_[:]
-        for child_old in children_old:
-            if hasattr(child_old, "_key"):
-                children_old_bykey[child_old._key] = child_old
-
         # We will mutate children_new to replace them with old elements if we can match them.
         children_new: list[Element] = component.children[:]
         for child_new in children_new:
-            if hasattr(child_new, "_key"):
-                if children_new_bykey.get(child_new._key, None) is not None:
+            if (key := child_new._key) is not None:
+                if children_new_bykey.get(key, None) is not None:
                     raise ValueError("Duplicate keys found in %s" % component)
-                children_new_bykey[child_new._key] = child_new
+                children_new_bykey[key] = child_new
+
+        # We will mutate children_old to reuse and remove old elements if we can match them.
+        # Ordering of children_old must be preserved for reverse deletion.
+        children_old: list[Element] = children_old_[:]
+        # Old children are only looked up by key for keyed new children, so
+        # if there are none we don't need the map. Usually children are unkeyed.
+        if children_new_bykey:
+            for child_old in children_old:
+                if (key := child_old._key) is not None:
+                    children_old_bykey[key] = child_old
 
         # We will not try to intelligently handle the situation where
         # an unkeyed element is added or removed.
@@ -1874,7 +2017,7 @@ class RenderEngine(object):
         i_new = 0
         while i_new < len(children_new):
             child_new = children_new[i_new]
-            if (key := getattr(child_new, "_key", None)) is not None:
+            if (key := child_new._key) is not None:
                 if (child_old_bykey := children_old_bykey.get(key, None)) is not None and elements_match(
                     child_old_bykey, child_new
                 ):
@@ -1939,24 +2082,30 @@ class RenderEngine(object):
         # Figure out which children can be re-used
         children = self._recycle_children(component, render_context)
 
-        props_dict = dict(component.props._items)
-        props_dict["children"] = list(children)
-        render_context.mark_props_change(component, PropsDict(props_dict))
+        old_children = component.children
+        if len(children) == len(old_children) and all(a is b for a, b in zip(children, old_children)):
+            # No children were replaced by recycled old children, so keep the
+            # current props. Usually there are no children at all.
+            # We still mark the props change so that the old props are recorded.
+            render_context.mark_props_change(component, component._props)
+        else:
+            render_context.mark_props_change(component, {**component._props, "children": list(children)})
         return render_context.widget_tree[component]
 
     def _render(self, component: Element, render_context: _RenderContext) -> _WidgetTree:
         if component in render_context.widget_tree:
             return render_context.widget_tree[component]
         try:
-            assert component._edifice_internal_references is not None
-            for ref in component._edifice_internal_references:
-                ref._value = component
-        except TypeError:
+            references = component._edifice_internal_references
+        except AttributeError:
+            # The slot is only set by Element.__init__.
             raise ValueError(
                 f"{component.__class__} is not correctly initialized. "
                 "Did you remember to call super().__init__() in the constructor? "
                 "(alternatively, the register_props decorator will also correctly initialize the component)"
             )
+        for ref in references:
+            ref._value = component
         component._controller = self._app
 
         if isinstance(component, QtWidgetElement):
@@ -2013,28 +2162,37 @@ class RenderEngine(object):
 
     def gen_qt_commands(self, element: QtWidgetElement, render_context: _RenderContext) -> list[CommandType]:
         """
-        Recursively generate the update commands for the widget tree.
+        Generate the update commands for the widget tree.
+
+        The commands for the children of an element come before the commands
+        for the element.
         """
         commands: list[CommandType] = []
         if self.is_stopped:
             return commands
 
-        children = _get_widget_children(render_context.widget_tree, element)
-        for child in children:
-            rendered = self.gen_qt_commands(child, render_context)
-            commands.extend(rendered)
+        widget_tree = render_context.widget_tree
+        # Depth-first post-order traversal with an explicit stack of
+        # (element, whether its children have been visited).
+        stack: list[tuple[QtWidgetElement, bool]] = [(element, False)]
+        while stack:
+            element, children_visited = stack.pop()
+            if not children_visited:
+                stack.append((element, True))
+                stack.extend((child, False) for child in reversed(_get_widget_children(widget_tree, element)))
+                continue
 
-        if not render_context.need_rerender(element):
-            return commands
+            if not render_context.need_rerender(element):
+                continue
 
-        old_props = render_context.get_old_props(element)
-        new_props = PropsDict({k: v for k, v in element.props._items if k not in old_props or old_props[k] != v})
+            old_props = render_context.get_old_props(element)
+            new_props = PropsDict(_changed_props(old_props, element._props))
 
-        # Call user provided render function and retrieve old results
-        prev_element = render_context.current_element
-        render_context.current_element = element
-        commands.extend(element._qt_update_commands(render_context.widget_tree, new_props))
-        render_context.current_element = prev_element
+            # Call user provided render function and retrieve old results
+            prev_element = render_context.current_element
+            render_context.current_element = element
+            commands.extend(element._qt_update_commands(widget_tree, new_props))
+            render_context.current_element = prev_element
         return commands
 
     def _request_rerender(self, components: list[Element]) -> RenderResult:
@@ -2070,15 +2228,13 @@ class RenderEngine(object):
         # So we do a complete render of each component individually, and then
         # we don't have to solve the problem of the order of rendering.
         for component in components_:
-            commands: list[CommandType] = []
-
             render_context = _RenderContext(self)
             local_state.render_context = render_context
 
             widget_tree = self._render(component, render_context)
 
             # Generate the update commands from the widget trees
-            commands.extend(self.gen_qt_commands(widget_tree.component, render_context))
+            commands = self.gen_qt_commands(widget_tree.component, render_context)
 
             # Update the stored component trees and widget trees
             self._component_tree.update(render_context.component_tree)
@@ -2099,8 +2255,11 @@ class RenderEngine(object):
         # after render, call the use_effect setup functions.
         # we want to guarantee that elements are fully rendered before
         # effects are performed.
-        for hooks in self._hook_effect.values():
-            for hook in hooks:
+        # Only the elements which scheduled a setup need to be visited.
+        hook_effect_setted = self._hook_effect_setted
+        self._hook_effect_setted = {}
+        for element in hook_effect_setted:
+            for hook in self._hook_effect.get(element, ()):
                 if hook.setup is not None:
                     if hook.cleanup is not None:
                         try:
@@ -2170,6 +2329,7 @@ class RenderEngine(object):
             # then this is the first render
             hook = _HookEffect(setup, None, dependencies)
             hooks.append(hook)
+            self._hook_effect_setted[element] = None
 
         else:
             # then this is not the first render
@@ -2177,6 +2337,7 @@ class RenderEngine(object):
             if hook.dependencies is None or hook.dependencies != dependencies:
                 # deps changed
                 hook.setup = setup
+                self._hook_effect_setted[element] = None
             hook.dependencies = dependencies
 
     def use_async(
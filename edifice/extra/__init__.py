@@ -1,5 +1,32 @@
-from .matplotlib_figure import MatplotlibFigure
-from .numpy_image import NumpyImage, NumpyArray, NumpyArray_to_QImage
-from .pyqtgraph_plot import PyQtPlot
+import importlib
+import typing as tp
+
+if tp.TYPE_CHECKING:
+    from .matplotlib_figure import MatplotlibFigure
+    from .numpy_image import NumpyImage, NumpyArray, NumpyArray_to_QImage
+    from .pyqtgraph_plot import PyQtPlot
 
 __all__ = ["MatplotlibFigure", "PyQtPlot", "NumpyImage", "NumpyArray", "NumpyArray_to_QImage"]
+
+# The extra Elements depend on large optional libraries (matplotlib, pyqtgraph,
+# numpy), so each submodule is only imported when one of its names is first used.
+_name_to_module = {
+    "MatplotlibFigure": ".matplotlib_figure",
+    "PyQtPlot": ".pyqtgraph_plot",
+    "NumpyImage": ".numpy_image",
+    "NumpyArray": ".numpy_image",
+    "NumpyArray_to_QImage": ".numpy_image",
+}
+
+
+def __getattr__(name: str) -> tp.Any:
+    if (module_name := _name_to_module.get(name)) is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the module so that later lookups don't come back here.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -32,12 +32,56 @@ class MatplotlibFigure(QtWidgetElement):
 
         MatplotlibFigure(plot_fun=plot_fun)
 
+    For plots which change frequently, such as while tracking the mouse,
+    clearing the Axes and replotting everything with :code:`plot_fun` is slow.
+    Instead, draw the parts which don't change with a :code:`plot_fun` which
+    is the same function on every render, and modify the existing artists in
+    :code:`update_fun`::
+
+        from matplotlib.backend_bases import MouseEvent
+        from edifice import component, use_state
+
+        def plot_fun(ax:Axes):
+            time_range = np.linspace(-10, 10, num=120)
+            ax.plot(time_range, np.sin(time_range))
+            ax.plot([0.0], [0.0], "ob")
+
+        @component
+        def Tracker(self):
+            x, x_set = use_state(0.0)
+
+            def on_mouse_move(event:MouseEvent):
+                if event.xdata is not None:
+                    x_set(event.xdata)
+
+            def update_fun(ax:Axes):
+                ax.lines[1].set_data([x], [np.sin(x)])
+
+            MatplotlibFigure(
+                plot_fun=plot_fun,
+                update_fun=update_fun,
+                on_figure_mouse_move=on_mouse_move,
+            ).render()
+
     Args:
         plot_fun:
             Function which takes **matplotlib**
             `Axes <https://matplotlib.org/stable/api/axes_api.html>`_
             and calls
             `Axes.plot <https://matplotlib.org/stable/api/_as_gen/matplotlib.axes.Axes.plot.html>`_.
+
+            When :code:`plot_fun` changes, the Axes are cleared and the figure is
+            redrawn from scratch.
+        update_fun:
+            Optional function which takes the **matplotlib**
+            `Axes <https://matplotlib.org/stable/api/axes_api.html>`_
+            already drawn by :code:`plot_fun` and modifies its artists in place,
+            for example with
+            `Line2D.set_data <https://matplotlib.org/stable/api/_as_gen/matplotlib.lines.Line2D.html#matplotlib.lines.Line2D.set_data>`_.
+
+            It is called after :code:`plot_fun`, and again whenever :code:`update_fun`
+            changes. When only :code:`update_fun` changes, the Axes are not cleared
+            before the figure is redrawn.
         on_figure_mouse_move:
             Handler for mouse move
             `MouseEvent <https://matplotlib.org/stable/api/backend_bases_api.html#matplotlib.backend_bases.MouseEvent>`_.
@@ -46,6 +90,7 @@ class MatplotlibFigure(QtWidgetElement):
     def __init__(
         self,
         plot_fun: tp.Callable[[Axes], None],
+        update_fun: tp.Callable[[Axes], None] | None = None,
         on_figure_mouse_move: tp.Callable[[MouseEvent], None] | None = None,
         **kwargs,
     ):
@@ -53,6 +98,7 @@ class MatplotlibFigure(QtWidgetElement):
         self._register_props(
             {
                 "plot_fun": plot_fun,
+                "update_fun": update_fun,
                 "on_figure_mouse_move": on_figure_mouse_move,
             }
         )
@@ -61,6 +107,10 @@ class MatplotlibFigure(QtWidgetElement):
         self.current_plot_fun: tp.Callable[[Axes], None] | None = None
         self.on_mouse_move_connect_id: int | None = None
 
+    def _on_figure_mouse_move(self, event: MouseEvent):
+        if (on_figure_mouse_move := self.props.on_figure_mouse_move) is not None:
+            on_figure_mouse_move(event)
+
     def _qt_update_commands(self, children, newprops):
         if self.underlying is None:
             # Default to maximum figsize https://matplotlib.org/stable/api/figure_api.html#matplotlib.figure.figaspect
@@ -72,27 +122,40 @@ class MatplotlibFigure(QtWidgetElement):
 
         commands = super()._qt_update_commands_super(children, newprops, self.underlying, None)
 
-        if "plot_fun" in newprops:
+        if "plot_fun" in newprops or "update_fun" in newprops:
 
             def _command_plot_fun(self):
-                self.current_plot_fun = tp.cast(tp.Callable[[Axes], None], self.props.plot_fun)
-                self.subplots.clear()
-                self.current_plot_fun(self.subplots)
-                self.underlying.draw()
-                # alternately we could do draw_idle() here, but I don't think it's
-                # any better and it messes up the mouse events.
+                plot_fun = tp.cast(tp.Callable[[Axes], None], self.props.plot_fun)
+                update_fun = tp.cast(tp.Callable[[Axes], None] | None, self.props.update_fun)
+                if plot_fun is not self.current_plot_fun:
+                    self.current_plot_fun = plot_fun
+                    self.subplots.clear()
+                    self.current_plot_fun(self.subplots)
+                    if update_fun is not None:
+                        update_fun(self.subplots)
+                    self.underlying.draw()
+                    # alternately we could do draw_idle() here, but I don't think it's
+                    # any better and it messes up the mouse events.
+                elif update_fun is not None and "update_fun" in newprops:
+                    # Same plot function as the one already drawn, so only
+                    # update the existing artists.
+                    update_fun(self.subplots)
+                    self.underlying.draw()
 
             commands.append(CommandType(_command_plot_fun, self))
         if "on_figure_mouse_move" in newprops:
 
             def _command_mouse_move(self):
-                if self.on_mouse_move_connect_id is not None:
-                    self.underlying.mpl_disconnect(self.on_mouse_move_connect_id)
+                # The handler usually changes on every render, so rather than
+                # reconnecting it each time we connect _on_figure_mouse_move
+                # once and let it look up the current handler.
                 if newprops["on_figure_mouse_move"] is not None:
-                    self.on_mouse_move_connect_id = self.underlying.mpl_connect(
-                        "motion_notify_event", newprops["on_figure_mouse_move"]
-                    )
-                else:
+                    if self.on_mouse_move_connect_id is None:
+                        self.on_mouse_move_connect_id = self.underlying.mpl_connect(
+                            "motion_notify_event", self._on_figure_mouse_move
+                        )
+                elif self.on_mouse_move_connect_id is not None:
+                    self.underlying.mpl_disconnect(self.on_mouse_move_connect_id)
                     self.on_mouse_move_connect_id = None
 
             commands.append(CommandType(_command_mouse_move, self))
@@ -34,6 +34,12 @@ class NumpyArray(Generic[T_Numpy_Array_co]):
         self.np_array = np_array
 
     def __eq__(self, other: "NumpyArray[T_Numpy_Array_co]") -> bool:
+        if self.np_array is other.np_array:
+            return True
+        # Compare the cheap metadata first so that a resized or retyped array
+        # doesn't need an elementwise comparison.
+        if self.np_array.shape != other.np_array.shape or self.dtype != other.dtype:
+            return False
         return np.array_equal(self.np_array, other.np_array, equal_nan=True)
 
 
@@ -1,4 +1,6 @@
+import functools
 import inspect
+from types import MappingProxyType
 import typing as tp
 import edifice as ed
 from edifice.engine import _HookState, PropsDict
@@ -6,13 +8,45 @@ from collections import defaultdict
 
 SELECTION_COLOR = "#ACCEF7"
 
+# Styles shared by every render of the inspector Elements, so that rendering
+# a node doesn't allocate new style dicts. They are read-only because they
+# are shared.
+_EMPTY_STYLE: tp.Mapping[str, tp.Any] = MappingProxyType({})
+_SELECTED_STYLE = MappingProxyType({"background-color": SELECTION_COLOR})
+_COLLAPSIBLE_STYLE = MappingProxyType({"margin-left": 5})
+_COLLAPSIBLE_SELECTED_STYLE = MappingProxyType({"margin-left": 5, "background-color": SELECTION_COLOR})
+_TREE_CHILDREN_STYLE = MappingProxyType({"align": "top", "margin-left": 20})
+_TREE_CHILDREN_COLLAPSED_STYLE = MappingProxyType({"align": "top", "margin-left": 20, "height": 0})
+_ROW_STYLE = MappingProxyType({"align": "left"})
+_COLUMN_STYLE = MappingProxyType({"align": "top"})
+_SCROLL_STYLE = MappingProxyType({"align": "top", "margin-left": 15})
+_PROP_KEY_STYLE = MappingProxyType({"font-weight": 600, "width": 140})
+_HEADING_STYLE = MappingProxyType({"font-size": "16px", "margin": 10, "margin-bottom": 0})
+
+
+@functools.cache
+def _class_source_info(cls: type) -> tuple[str | None, int | None]:
+    """
+    The source file and line number where cls is defined.
+
+    Cached because inspect.getsourcelines reads and parses the source file.
+    """
+    module = inspect.getmodule(cls)
+    assert module is not None
+    lineno = None
+    try:
+        lineno = inspect.getsourcelines(cls)[1]
+    except Exception:
+        pass
+    return module.__file__, lineno
+
 
 @ed.component
 def ElementLabel(self, root: ed.Element, current_selection: ed.Element | None, on_click: tp.Callable[[], None]):
     setattr(self, "__edifice_inspector_element", True)
     ed.Label(
         root.__class__.__name__,
-        style={"background-color": SELECTION_COLOR} if root == current_selection else {},
+        style=_SELECTED_STYLE if root == current_selection else _EMPTY_STYLE,
         on_click=lambda _ev: on_click(),
     ).render()
 
@@ -27,10 +61,8 @@ def Collapsible(
     toggle: tp.Callable[[], None],
 ):
     setattr(self, "__edifice_inspector_element", True)
-    root_style: dict[str, tp.Any] = {"margin-left": 5}
-    if root == current_selection:
-        root_style["background-color"] = SELECTION_COLOR
-    with ed.View(layout="row", style={"align": "left"}).render():
+    root_style = _COLLAPSIBLE_SELECTED_STYLE if root == current_selection else _COLLAPSIBLE_STYLE
+    with ed.View(layout="row", style=_ROW_STYLE).render():
         ed.Icon(
             "caret-right",
             rotation=0 if collapsed else 90,
@@ -51,10 +83,8 @@ def TreeView(
 
     collapsed, collapsed_set = ed.use_state(True)
 
-    child_style = {"align": "top", "margin-left": 20}
-    if collapsed:
-        child_style["height"] = 0
-    with ed.View(layout="column", style={"align": "top"}).render():
+    child_style = _TREE_CHILDREN_COLLAPSED_STYLE if collapsed else _TREE_CHILDREN_STYLE
+    with ed.View(layout="column", style=_COLUMN_STYLE).render():
         Collapsible(
             root=root,
             current_selection=current_selection,
@@ -82,13 +112,13 @@ def StateView(
 
     with ed.ScrollView(
         layout="column",
-        style={"align": "top", "margin-left": 15},
+        style=_SCROLL_STYLE,
     ).render():
         if component in hook_state:
             for s in hook_state[component]:
                 with ed.View(
                     layout="row",
-                    style={"align": "left"},
+                    style=_ROW_STYLE,
                 ).render():
                     ed.Label(
                         text=str(s.state),
@@ -99,21 +129,21 @@ def StateView(
 @ed.component
 def PropsView(self, props: PropsDict):
     setattr(self, "__edifice_inspector_element", True)
-    with ed.ScrollView(layout="column", style={"align": "top", "margin-left": 15}).render():
-        for key in props._keys:
+    with ed.ScrollView(layout="column", style=_SCROLL_STYLE).render():
+        for key, value in props._items:
             with ed.View(
                 layout="row",
-                style={"align": "left"},
+                style=_ROW_STYLE,
             ).render():
                 ed.Label(
                     key + ":",
                     selectable=True,
-                    style={"font-weight": 600, "width": 140},
+                    style=_PROP_KEY_STYLE,
                 ).render()
                 ed.Label(
-                    str(props[key]),
+                    str(value),
                     selectable=True,
-                    style={},
+                    style=_EMPTY_STYLE,
                 ).render()
 
 
@@ -128,23 +158,15 @@ def ElementView(
     cls = component.__class__
     if value := getattr(cls, "_edifice_original", None):
         cls = value
-    module = inspect.getmodule(cls)
-    lineno = None
-    try:
-        lineno = inspect.getsourcelines(cls)[1]
-    except Exception:
-        pass
-    heading_style = {"font-size": "16px", "margin": 10, "margin-bottom": 0}
-
-    assert module is not None
+    file_name, lineno = _class_source_info(cls)
     with ed.View(layout="column", style={"align": "top", "min-width": 450, "min-height": 450}).render():
         ed.Label(cls.__name__, selectable=True, style={"font-size": "20px", "margin": 10}).render()
         ed.Label(
-            "Class defined in " + str(module.__file__) + ":" + str(lineno), selectable=True, style={"margin-left": 10}
+            "Class defined in " + str(file_name) + ":" + str(lineno), selectable=True, style={"margin-left": 10}
         ).render()
-        ed.Label("Props", style=heading_style).render()
+        ed.Label("Props", style=_HEADING_STYLE).render()
         PropsView(component.props).render()
-        ed.Label("State", style=heading_style).render()
+        ed.Label("State", style=_HEADING_STYLE).render()
         StateView(component, hook_state, refresh_trigger).render()
 
 
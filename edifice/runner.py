@@ -77,7 +77,7 @@ def _reload(module):
 
 def _message_app(app, src_path, components_list):
     # Alert the main QThread about the change
-    app._class_rerender_queue.put_nowait((src_path, components_list))
+    app._class_rerender_queue.append((src_path, components_list))
     logger.info("Detected change in %s.", src_path)
     app.app.postEvent(app._event_receiver, QtCore.QEvent(QtCore.QEvent.Type(app._file_change_rerender_event_type)))
     return app._class_rerender_response_queue.get()
@@ -4,7 +4,6 @@
 
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 import edifice as ed
 from typing import cast
 
@@ -65,9 +64,9 @@ def Main(self):
         """
         Test async callbacks from another thread.
         """
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as pool:
-            await loop.run_in_executor(pool, lambda: callback1(v))
+        # The loop's default executor reuses its threads, so we don't
+        # start a new thread pool for every slider change.
+        await asyncio.get_running_loop().run_in_executor(None, lambda: callback1(v))
 
     ###########
 
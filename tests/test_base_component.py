@@ -24,6 +24,7 @@ if QtWidgets.QApplication.instance() is None:
 
 
 class MockUnderlying(object):
+    __slots__ = ()
     setStyleSheet = "setStyleSheet"
     move = "move"
 
@@ -233,27 +234,26 @@ class WidgetTreeTestCase(unittest.TestCase):
         assert qt_icon is not None
         style = qt_icon.style()
         assert style is not None
-        assert icon.underlying is not None
         self.assertCountEqual(
             commands,
             [
                 CommandType(icon._render_image, *render_img_args),
                 CommandType(qt_icon.setStyleSheet, "QWidget#%s{}" % id(icon)),
                 CommandType(qt_icon.setProperty, "css_class", []),
-                CommandType(style.unpolish, icon.underlying),
-                CommandType(style.polish, icon.underlying),
+                CommandType(style.unpolish, qt_icon),
+                CommandType(style.polish, qt_icon),
                 CommandType(qt_icon.setContextMenuPolicy, QtCore.Qt.ContextMenuPolicy.DefaultContextMenu),
                 CommandType(qt_icon.setCursor, QtCore.Qt.CursorShape.ArrowCursor),
-                CommandType(icon._set_on_key_down, icon.underlying, None),
-                CommandType(icon._set_on_key_up, icon.underlying, None),
-                CommandType(icon._set_on_mouse_enter, icon.underlying, None),
-                CommandType(icon._set_on_mouse_leave, icon.underlying, None),
-                CommandType(icon._set_on_mouse_down, icon.underlying, None),
-                CommandType(icon._set_on_mouse_up, icon.underlying, None),
-                CommandType(icon._set_on_mouse_move, icon.underlying, None),
-                CommandType(icon._set_on_click, icon.underlying, None),
-                CommandType(icon._set_on_drop, icon.underlying, None),
-                CommandType(icon._set_on_resize, icon.underlying, None),
+                CommandType(icon._set_on_key_down, qt_icon, None),
+                CommandType(icon._set_on_key_up, qt_icon, None),
+                CommandType(icon._set_on_mouse_enter, qt_icon, None),
+                CommandType(icon._set_on_mouse_leave, qt_icon, None),
+                CommandType(icon._set_on_mouse_down, qt_icon, None),
+                CommandType(icon._set_on_mouse_up, qt_icon, None),
+                CommandType(icon._set_on_mouse_move, qt_icon, None),
+                CommandType(icon._set_on_click, qt_icon, None),
+                CommandType(icon._set_on_drop, qt_icon, None),
+                CommandType(icon._set_on_resize, qt_icon, None),
             ],
         )
         icon._render_image(*render_img_args)
@@ -269,57 +269,58 @@ class WidgetTreeTestCase(unittest.TestCase):
 
         label1_commands = label_tree(label1)
         label2_commands = label_tree(label2)
+        label1_underlying = label1.underlying
+        label2_underlying = label2.underlying
         context = MockRenderContext(eng)
         context.widget_tree[view] = engine._WidgetTree(view, [label1])
         commands = eng.gen_qt_commands(view, context)
 
-        label1.underlying.font().pointSize()
-
-        commands_expected = label1_commands + [
-            CommandType(view.underlying.setStyleSheet, "QWidget#%s{}" % id(view)),
-            CommandType(view.underlying.setProperty, "css_class", []),
-            CommandType(view.underlying.style().unpolish, view.underlying),
-            CommandType(view.underlying.style().polish, view.underlying),
-            CommandType(view.underlying.setContextMenuPolicy, QtCore.Qt.ContextMenuPolicy.DefaultContextMenu),
-            CommandType(view.underlying.setCursor, QtCore.Qt.CursorShape.ArrowCursor),
-            CommandType(view._set_on_key_down, view.underlying, None),
-            CommandType(view._set_on_key_up, view.underlying, None),
-            CommandType(view._set_on_mouse_enter, view.underlying, None),
-            CommandType(view._set_on_mouse_leave, view.underlying, None),
-            CommandType(view._set_on_mouse_down, view.underlying, None),
-            CommandType(view._set_on_mouse_up, view.underlying, None),
-            CommandType(view._set_on_mouse_move, view.underlying, None),
-            CommandType(view._set_on_click, view.underlying, None),
-            CommandType(view._set_on_drop, view.underlying, None),
-            CommandType(view._add_child, 0, label1.underlying),
-            CommandType(view._set_on_resize, view.underlying, None),
-        ]
+        label1_underlying.font().pointSize()
+
+        def view_commands(v):
+            # The commands which every render of a View issues.
+            underlying = v.underlying
+            style = underlying.style()
+            return [
+                CommandType(underlying.setStyleSheet, "QWidget#%s{}" % id(v)),
+                CommandType(underlying.setProperty, "css_class", []),
+                CommandType(style.unpolish, underlying),
+                CommandType(style.polish, underlying),
+                CommandType(underlying.setContextMenuPolicy, QtCore.Qt.ContextMenuPolicy.DefaultContextMenu),
+                CommandType(underlying.setCursor, QtCore.Qt.CursorShape.ArrowCursor),
+                CommandType(v._set_on_key_down, underlying, None),
+                CommandType(v._set_on_key_up, underlying, None),
+                CommandType(v._set_on_mouse_enter, underlying, None),
+                CommandType(v._set_on_mouse_leave, underlying, None),
+                CommandType(v._set_on_mouse_down, underlying, None),
+                CommandType(v._set_on_mouse_up, underlying, None),
+                CommandType(v._set_on_mouse_move, underlying, None),
+                CommandType(v._set_on_click, underlying, None),
+                CommandType(v._set_on_drop, underlying, None),
+                CommandType(v._set_on_resize, underlying, None),
+            ]
+
+        # The view's own commands are the same for every render, so build them once.
+        view_commands_expected = view_commands(view)
 
+        commands_expected = (
+            label1_commands
+            + view_commands_expected
+            + [
+                CommandType(view._add_child, 0, label1_underlying),
+            ]
+        )
         self.assertCountEqual(commands, commands_expected)
+
         context = MockRenderContext(eng)
         context.widget_tree[view] = engine._WidgetTree(view, [label1, label2])
         commands = eng.gen_qt_commands(view, context)
         commands_expected = (
             label1_commands
             + label2_commands
+            + view_commands_expected
             + [
-                CommandType(view.underlying.setStyleSheet, "QWidget#%s{}" % id(view)),
-                CommandType(view.underlying.setProperty, "css_class", []),
-                CommandType(view.underlying.style().unpolish, view.underlying),
-                CommandType(view.underlying.style().polish, view.underlying),
-                CommandType(view.underlying.setContextMenuPolicy, QtCore.Qt.ContextMenuPolicy.DefaultContextMenu),
-                CommandType(view.underlying.setCursor, QtCore.Qt.CursorShape.ArrowCursor),
-                CommandType(view._set_on_key_down, view.underlying, None),
-                CommandType(view._set_on_key_up, view.underlying, None),
-                CommandType(view._set_on_mouse_enter, view.underlying, None),
-                CommandType(view._set_on_mouse_leave, view.underlying, None),
-                CommandType(view._set_on_mouse_down, view.underlying, None),
-                CommandType(view._set_on_mouse_up, view.underlying, None),
-                CommandType(view._set_on_mouse_move, view.underlying, None),
-                CommandType(view._set_on_click, view.underlying, None),
-                CommandType(view._set_on_drop, view.underlying, None),
-                CommandType(view._add_child, 1, label2.underlying),
-                CommandType(view._set_on_resize, view.underlying, None),
+                CommandType(view._add_child, 1, label2_underlying),
             ]
         )
         self.assertCountEqual(commands, commands_expected)
@@ -328,44 +329,17 @@ class WidgetTreeTestCase(unittest.TestCase):
         context = MockRenderContext(eng)
         context.widget_tree[view] = engine._WidgetTree(view, [label2, inner_view])
         commands = eng.gen_qt_commands(view, context)
-        commands_expected = label2_commands + [
-            CommandType(view.underlying.setStyleSheet, "QWidget#%s{}" % id(view)),
-            CommandType(view.underlying.setProperty, "css_class", []),
-            CommandType(view.underlying.style().unpolish, view.underlying),
-            CommandType(view.underlying.style().polish, view.underlying),
-            CommandType(view.underlying.setContextMenuPolicy, QtCore.Qt.ContextMenuPolicy.DefaultContextMenu),
-            CommandType(view.underlying.setCursor, QtCore.Qt.CursorShape.ArrowCursor),
-            CommandType(view._set_on_key_down, view.underlying, None),
-            CommandType(view._set_on_key_up, view.underlying, None),
-            CommandType(view._set_on_mouse_enter, view.underlying, None),
-            CommandType(view._set_on_mouse_leave, view.underlying, None),
-            CommandType(view._set_on_mouse_down, view.underlying, None),
-            CommandType(view._set_on_mouse_up, view.underlying, None),
-            CommandType(view._set_on_mouse_move, view.underlying, None),
-            CommandType(view._set_on_click, view.underlying, None),
-            CommandType(view._set_on_drop, view.underlying, None),
-            CommandType(view._set_on_resize, view.underlying, None),
-            CommandType(inner_view.underlying.setStyleSheet, "QWidget#%s{}" % id(inner_view)),
-            CommandType(inner_view.underlying.setProperty, "css_class", []),
-            CommandType(inner_view.underlying.style().unpolish, inner_view.underlying),
-            CommandType(inner_view.underlying.style().polish, inner_view.underlying),
-            CommandType(inner_view.underlying.setContextMenuPolicy, QtCore.Qt.ContextMenuPolicy.DefaultContextMenu),
-            CommandType(inner_view.underlying.setCursor, QtCore.Qt.CursorShape.ArrowCursor),
-            CommandType(inner_view._set_on_key_down, inner_view.underlying, None),
-            CommandType(inner_view._set_on_key_up, inner_view.underlying, None),
-            CommandType(inner_view._set_on_mouse_enter, inner_view.underlying, None),
-            CommandType(inner_view._set_on_mouse_leave, inner_view.underlying, None),
-            CommandType(inner_view._set_on_mouse_down, inner_view.underlying, None),
-            CommandType(inner_view._set_on_mouse_up, inner_view.underlying, None),
-            CommandType(inner_view._set_on_mouse_move, inner_view.underlying, None),
-            CommandType(inner_view._set_on_click, inner_view.underlying, None),
-            CommandType(inner_view._set_on_drop, inner_view.underlying, None),
-            CommandType(inner_view._set_on_resize, inner_view.underlying, None),
-            CommandType(view._soft_delete_child, 1, label2),
-            CommandType(view._delete_child, 0, label1),
-            CommandType(view._add_child, 0, label2.underlying),
-            CommandType(view._add_child, 1, inner_view.underlying),
-        ]
+        commands_expected = (
+            label2_commands
+            + view_commands_expected
+            + view_commands(inner_view)
+            + [
+                CommandType(view._soft_delete_child, 1, label2),
+                CommandType(view._delete_child, 0, label1),
+                CommandType(view._add_child, 0, label2_underlying),
+                CommandType(view._add_child, 1, inner_view.underlying),
+            ]
+        )
         self.assertCountEqual(commands, commands_expected)
 
 
@@ -1,5 +1,4 @@
 import unittest
-import unittest.mock
 from edifice.app import App, Window
 import edifice.engine as engine
 import edifice.base_components as base_components
@@ -22,27 +21,6 @@ def Value(self, value):
     base_components.View().render()
 
 
-class OtherMockElement(ed.Element):
-    def __init__(self):
-        super().__init__()
-
-        class MockController(object):
-            _request_rerender = unittest.mock.MagicMock()
-
-        self._controller = MockController()
-
-
-class MockBrokenElement(ed.Element):
-    def __init__(self):
-        super().__init__()
-
-        class MockController(object):
-            def _request_rerender(*args, **kwargs):
-                raise ValueError("I am broken")
-
-        self._controller = MockController()
-
-
 class ElementTestCase(unittest.TestCase):
     def test_render_view_replacement(self):
         """
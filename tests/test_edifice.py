@@ -414,6 +414,86 @@ class RenderTestCase(unittest.TestCase):
         self.assertEqual(inner_comp.count, 2)
         self.assertEqual(inner_comp.props.val, 4)
 
+    def test_unchanged_leaf_no_commands(self):
+        class TestCompOuter(Element):
+            def _render_element(self):
+                return base_components.View()(
+                    base_components.Label("Unchanged"),
+                    base_components.Label(str(self.value)),
+                )
+
+        test_comp = TestCompOuter()
+        test_comp.value = 2
+        app = engine.RenderEngine(test_comp)
+        app._request_rerender([test_comp])
+        view = app._component_tree[test_comp][0]
+        label_unchanged, label_changed = app._component_tree[view]
+
+        test_comp.value = 4
+        render_result = app._request_rerender([test_comp])
+        targets = {getattr(command.fn, "__self__", None) for command in render_result.commands}
+        self.assertNotIn(label_unchanged.underlying, targets)
+        self.assertNotIn(label_unchanged, targets)
+        self.assertIn(label_changed.underlying, targets)
+        self.assertEqual(label_changed.underlying.text(), "4")
+
+    def test_unchanged_component_root_no_commands(self):
+        @component
+        def Child(self, x):
+            base_components.Label("constant").render()
+
+        @component
+        def Parent(self, x):
+            Child(x).render()
+
+        root = Parent(1)
+        app = engine.RenderEngine(root)
+        app._request_rerender([root])
+        label = app._widget_tree[root].component
+
+        root._props["x"] = 2
+        render_result = app._request_rerender([root])
+        self.assertIs(app._widget_tree[root].component, label)
+        targets = {getattr(command.fn, "__self__", None) for command in render_result.commands}
+        self.assertNotIn(label.underlying, targets)
+        self.assertNotIn(label, targets)
+
+    def test_unchanged_component_with_reference(self):
+        refs = []
+        render_count = [0]
+        created = []
+
+        @component
+        def Inner(self):
+            render_count[0] += 1
+            base_components.Label("Inner").render()
+
+        @component
+        def Outer(self, x):
+            ref = Reference()
+            refs.append(ref)
+            with base_components.View().render():
+                base_components.Label(str(x)).render()
+                inner = Inner().register_ref(ref)
+                created.append(inner)
+                inner.render()
+
+        root = Outer(1)
+        app = engine.RenderEngine(root)
+        app._request_rerender([root])
+        self.assertEqual(render_count[0], 1)
+        retained = refs[0]()
+        self.assertIs(retained, created[0])
+
+        root._props["x"] = 2
+        app._request_rerender([root])
+        # The re-created Inner has equal props, so the retained Inner is
+        # not rendered again, and the Reference registered on the new Inner
+        # points to the retained Inner rather than to the discarded Element.
+        self.assertEqual(render_count[0], 1)
+        self.assertEqual(len(refs), 2)
+        self.assertIs(refs[1](), retained)
+
     def test_render_exception(self):
         class TestCompInner1(Element):
             def __init__(self, val):
@@ -648,5 +728,30 @@ class RefreshClassTestCase(unittest.TestCase):
         )
 
 
+class PropsDictTestCase(unittest.TestCase):
+    def test_missing_attribute(self):
+        props = PropsDict({"a": 1})
+        self.assertEqual(props.a, 1)
+        self.assertTrue(hasattr(props, "a"))
+        self.assertFalse(hasattr(props, "b"))
+        self.assertEqual(getattr(props, "b", 2), 2)
+        with self.assertRaises(AttributeError):
+            props.b
+
+    def test_component_props_with_var_args(self):
+        @component
+        def Foo(self, a, *args, b=2, **kwargs):
+            pass
+
+        props = Foo(1).props
+        self.assertEqual(props.a, 1)
+        self.assertEqual(props.b, 2)
+        self.assertEqual(props.children, [])
+        self.assertFalse(hasattr(props, "args"))
+        self.assertFalse(hasattr(props, "kwargs"))
+        with self.assertRaises(AttributeError):
+            props.kwargs
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,12 @@
 import asyncio as asyncio
 import unittest
 
-from edifice import App
+try:
+    import matplotlib  # noqa: F401
+except ImportError:
+    raise unittest.SkipTest("matplotlib is not installed")
+
+from edifice import App, component, engine
 
 from edifice.qt import QT_VERSION
 
@@ -14,6 +19,7 @@ if QtWidgets.QApplication.instance() is None:
     app_obj = QtWidgets.QApplication(["-platform", "offscreen"])
 
 from examples.example_matplotlib_figure import Main
+from edifice.extra import MatplotlibFigure
 
 
 class IntegrationTestCase(unittest.TestCase):
@@ -22,6 +28,37 @@ class IntegrationTestCase(unittest.TestCase):
         with my_app.start_loop() as loop:
             loop.call_later(0.1, my_app.stop)
 
+    def test_update_fun(self):
+        calls = []
+
+        def plot_fun(ax):
+            calls.append("plot")
+            ax.plot([0.0, 1.0], [0.0, 1.0])
+
+        @component
+        def Parent(self, x):
+            def update_fun(ax):
+                calls.append(("update", x))
+
+            MatplotlibFigure(plot_fun, update_fun=update_fun).render()
+
+        root = Parent(1)
+        render_engine = engine.RenderEngine(root)
+        render_engine._request_rerender([root])
+        self.assertEqual(calls, ["plot", ("update", 1)])
+        figure = render_engine._widget_tree[root].component
+        axes = figure.subplots
+        assert axes is not None
+        line = axes.lines[0]
+
+        # Rerender the parent so that only update_fun changes.
+        root._props["x"] = 2
+        render_engine._request_rerender([root])
+        self.assertIs(render_engine._widget_tree[root].component, figure)
+        self.assertEqual(calls, ["plot", ("update", 1), ("update", 2)])
+        # The Axes were not cleared
+        self.assertIs(axes.lines[0], line)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,10 @@
 import asyncio as asyncio
 import unittest
-import numpy as np
+
+try:
+    import numpy as np
+except ImportError:
+    raise unittest.SkipTest("numpy is not installed")
 
 from edifice import engine, Image
 from edifice.extra import NumpyArray_to_QImage, NumpyImage, NumpyArray
@@ -36,3 +40,6 @@ class NumpyImageTest(unittest.TestCase):
         assert NumpyArray(np.zeros((100, 100, 3))) == NumpyArray(np.zeros((100, 100, 3)))
         assert NumpyArray(np.zeros((100, 100, 3))) != NumpyArray(np.zeros((100, 100)))
         assert NumpyArray(np.zeros((100, 100, 3))) != NumpyArray(np.ones((100, 100, 3)))
+        assert NumpyArray(np.zeros((100, 100, 3), dtype=np.uint8)) != NumpyArray(np.zeros((100, 100, 3)))
+        a = np.zeros((100, 100, 3))
+        assert NumpyArray(a) == NumpyArray(a)
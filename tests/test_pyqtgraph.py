@@ -1,6 +1,11 @@
 import asyncio as asyncio
 import unittest
 
+try:
+    import pyqtgraph  # noqa: F401
+except ImportError:
+    raise unittest.SkipTest("pyqtgraph is not installed")
+
 from edifice import App
 
 from edifice.qt import QT_VERSION
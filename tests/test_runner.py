@@ -8,7 +8,6 @@ class ReloadTestCase(unittest.TestCase):
         import example_file
 
         old_comp_a, old_comp_b = example_file.ElementA, example_file.ElementB
-        print("Oldest", id(old_comp_a))
 
         comp_list, new_components = runner._reload_components(example_file)
         new_comp_a, new_comp_b = example_file.ElementA, example_file.ElementB
@@ -35,7 +35,6 @@ class IntegrationTestCase(unittest.TestCase):
                 super().__init__()
 
             def _render_element(self):
-                print("TestComp instance " + str(id(self)))
                 x, x_setter = use_state(0)
                 return View(style={"align": "top"})(
                     *[Label(text=str(i)) for i in range(x)],